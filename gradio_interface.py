@@ -1,7 +1,37 @@
+import asyncio
+import logging
+
 import gradio as gr
 
 from weaviate_service import WeaviateService
 
+logger = logging.getLogger(__name__)
+
+ANY_GENRE = "Any"
+
+# TMDB genre names mapped to the ids stored in `genre_ids`
+GENRES = {
+    "Action": 28,
+    "Adventure": 12,
+    "Animation": 16,
+    "Comedy": 35,
+    "Crime": 80,
+    "Documentary": 99,
+    "Drama": 18,
+    "Family": 10751,
+    "Fantasy": 14,
+    "History": 36,
+    "Horror": 27,
+    "Music": 10402,
+    "Mystery": 9648,
+    "Romance": 10749,
+    "Science Fiction": 878,
+    "TV Movie": 10770,
+    "Thriller": 53,
+    "War": 10752,
+    "Western": 37,
+}
+
 
 class GradioInterface:
     """Gradio interface for the movie search application."""
@@ -9,18 +39,48 @@ class GradioInterface:
     def __init__(self, weaviate_service: WeaviateService):
         self.weaviate_service = weaviate_service
 
-    def search_movies(self, query: str):
+    async def search_movies(
+        self, query: str, year_min: float | None = None, genre: str = ANY_GENRE
+    ):
         """Search function for Gradio interface."""
-        print(f"👤 User search request: '{query}'")
-        results, error = self.weaviate_service.search_movies(query)
+        logger.debug(
+            "👤 User search request: '%s' (year_min: %s, genre: %s)",
+            query,
+            year_min,
+            genre,
+        )
+        results, error = await self.weaviate_service.search_movies(
+            query,
+            year_min=int(year_min) if year_min else None,
+            genre_id=GENRES.get(genre),
+        )
 
         if error:
-            print(f"❌ Search failed: {error}")
+            logger.debug("❌ Search failed: %s", error)
             return error
 
-        print("✅ Search results returned to user")
+        logger.debug("✅ Search results returned to user")
         return results
 
+    async def batched_search_movies(
+        self,
+        queries: list[str],
+        years_min: list[float | None],
+        genres: list[str],
+    ):
+        """Batched search function for Gradio; distinct searches run concurrently."""
+        searches = list(zip(queries, years_min, genres))
+        unique_searches = list(set(searches))
+        unique_results = dict(
+            zip(
+                unique_searches,
+                await asyncio.gather(
+                    *(self.search_movies(*search) for search in unique_searches)
+                ),
+            )
+        )
+        return ([unique_results[search] for search in searches],)
+
     def create_interface(self):
         """Create and return the Gradio interface."""
 
@@ -37,6 +97,19 @@ class GradioInterface:
                 placeholder="Enter your search query (e.g., 'dystopian future', 'romantic comedy', 'action movies')",
                 interactive=True,
             )
+            with gr.Row():
+                year_min_input = gr.Number(
+                    label="Released in or after (year)",
+                    value=None,
+                    precision=0,
+                    minimum=1900,
+                    maximum=2100,
+                )
+                genre_input = gr.Dropdown(
+                    label="Genre",
+                    choices=[ANY_GENRE, *GENRES],
+                    value=ANY_GENRE,
+                )
             search_btn = gr.Button("Search", variant="primary")
 
             results_output = gr.Textbox(
@@ -49,11 +122,22 @@ class GradioInterface:
 
             # Event handlers
             search_btn.click(
-                fn=self.search_movies, inputs=[query_input], outputs=[results_output]
+                fn=self.batched_search_movies,
+                inputs=[query_input, year_min_input, genre_input],
+                outputs=[results_output],
+                batch=True,
+                max_batch_size=16,
             )
 
             query_input.submit(
-                fn=self.search_movies, inputs=[query_input], outputs=[results_output]
+                fn=self.batched_search_movies,
+                inputs=[query_input, year_min_input, genre_input],
+                outputs=[results_output],
+                batch=True,
+                max_batch_size=16,
             )
 
+        # Queue requests so concurrent users are served by a bounded worker pool
+        demo.queue(default_concurrency_limit=8, max_size=64)
+
         return demo
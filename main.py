@@ -1,4 +1,10 @@
-import threading
+import asyncio
+import contextlib
+import logging
+
+import gradio as gr
+import uvicorn
+from fastapi import FastAPI
 
 from gradio_interface import GradioInterface
 from weaviate_service import WeaviateService
@@ -6,20 +12,32 @@ from weaviate_service import WeaviateService
 
 def main():
     """Main function to orchestrate the application."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+
     # Initialize Weaviate service
     weaviate_service = WeaviateService()
 
-    # Initialize Weaviate in a separate thread to avoid blocking
-    init_thread = threading.Thread(target=weaviate_service.initialize)
-    init_thread.daemon = True
-    init_thread.start()
-
     # Create Gradio interface
     gradio_interface = GradioInterface(weaviate_service)
     demo = gradio_interface.create_interface()
 
-    # Launch the application
-    demo.launch(server_name="0.0.0.0", server_port=8008, share=False, show_error=True)
+    @contextlib.asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Initialize Weaviate in the background on the server's event loop
+        init_task = asyncio.create_task(weaviate_service.initialize())
+        yield
+        # Stop an unfinished initialization before closing its connection
+        init_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await init_task
+        await weaviate_service.close()
+
+    app = gr.mount_gradio_app(FastAPI(lifespan=lifespan), demo, path="/")
+
+    # Launch the application; the "auto" loop runs on uvloop when installed
+    uvicorn.run(app, host="0.0.0.0", port=8008, loop="auto")
 
 
 if __name__ == "__main__":
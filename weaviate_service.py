@@ -1,87 +1,377 @@
+import asyncio
+import contextlib
+import hashlib
 import json
+import logging
 import os
+import random
+import sqlite3
+import struct
+import threading
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 
-import pandas as pd
+import ijson
 import requests
 import weaviate
 import weaviate.classes.config as wc
 import weaviate.classes.query as wq
+from cachetools import TTLCache
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
+from weaviate.classes.data import DataObject
+from weaviate.exceptions import WeaviateBaseError
 from weaviate.util import generate_uuid5
 
+logger = logging.getLogger(__name__)
+
+OPENAI_EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Truncated (Matryoshka) embedding size, shared by objects and queries
+EMBEDDING_DIMENSIONS = 512
+RESULT_SEPARATOR = "─" * 50
+# Attempts per import batch before its remaining objects count as failed
+IMPORT_MAX_ATTEMPTS = 5
+# Collection description set once every movie has been imported
+IMPORT_COMPLETE_DESCRIPTION = "Movies 1990-2024 (import complete)"
+# How long a search waits for an in-progress initialization
+READY_TIMEOUT_SECONDS = 5
+
+
+def _create_http_session() -> requests.Session:
+    """Create an HTTP session with pooled, retrying connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared so the dataset download and query embeddings reuse TLS connections
+_http = _create_http_session()
+
+
+class _EmbeddingDiskCache:
+    """SQLite-backed LRU store of query embeddings, kept as float16 blobs."""
+
+    def __init__(self, max_entries: int = 10_000, prune_every: int = 100):
+        self._conn = None
+        self._disabled = False
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._prune_every = prune_every
+        self._puts_since_prune = 0
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if self._conn is None and not self._disabled:
+            path = os.getenv("EMBEDDING_CACHE_PATH", ".embedding_cache.sqlite3")
+            conn = None
+            try:
+                conn = sqlite3.connect(path, check_same_thread=False)
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS query_embeddings "
+                        "(query_hash TEXT PRIMARY KEY, embedding BLOB NOT NULL, "
+                        "last_used REAL NOT NULL)"
+                    )
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS query_embeddings_last_used "
+                        "ON query_embeddings (last_used)"
+                    )
+            except sqlite3.Error as e:
+                # The cache is optional; don't retry opening it on every query
+                logger.warning(
+                    "⚠️  Embedding disk cache at %s unavailable, continuing without it: %s",
+                    path,
+                    e,
+                )
+                self._disabled = True
+                if conn is not None:
+                    conn.close()
+            else:
+                self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _key(query: str) -> str:
+        # Include the model settings so changing them never serves stale vectors
+        key = f"{EMBEDDING_MODEL}:{EMBEDDING_DIMENSIONS}:{query}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, query: str) -> tuple[float, ...] | None:
+        key = self._key(query)
+        with self._lock:
+            if (conn := self._connection()) is None:
+                return None
+            try:
+                with conn:
+                    row = conn.execute(
+                        "SELECT embedding FROM query_embeddings WHERE query_hash = ?",
+                        (key,),
+                    ).fetchone()
+                    if row is not None:
+                        conn.execute(
+                            "UPDATE query_embeddings SET last_used = ? "
+                            "WHERE query_hash = ?",
+                            (time.time(), key),
+                        )
+            except sqlite3.Error as e:
+                logger.warning("⚠️  Embedding disk cache read failed: %s", e)
+                return None
+        if row is None:
+            return None
+        blob = row[0]
+        return struct.unpack(f"<{len(blob) // 2}e", blob)
+
+    def put(self, query: str, embedding: tuple[float, ...]):
+        blob = struct.pack(f"<{len(embedding)}e", *embedding)
+        with self._lock:
+            if (conn := self._connection()) is None:
+                return
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO query_embeddings "
+                        "(query_hash, embedding, last_used) VALUES (?, ?, ?)",
+                        (self._key(query), blob, time.time()),
+                    )
+                    # Periodically evict the least recently used entries over
+                    # the cap
+                    self._puts_since_prune += 1
+                    if self._puts_since_prune >= self._prune_every:
+                        self._puts_since_prune = 0
+                        conn.execute(
+                            "DELETE FROM query_embeddings WHERE query_hash NOT IN "
+                            "(SELECT query_hash FROM query_embeddings "
+                            "ORDER BY last_used DESC LIMIT ?)",
+                            (self._max_entries,),
+                        )
+            except sqlite3.Error as e:
+                logger.warning("⚠️  Embedding disk cache write failed: %s", e)
+
+
+_embedding_disk_cache = _EmbeddingDiskCache()
+
+
+@lru_cache(maxsize=1024)
+def _embed_query(query: str) -> tuple[float, ...]:
+    """Embed a normalized query string with OpenAI, caching it in memory and on disk."""
+    if (embedding := _embedding_disk_cache.get(query)) is not None:
+        return embedding
+
+    resp = _http.post(
+        OPENAI_EMBEDDINGS_URL,
+        headers={"Authorization": f"Bearer {os.getenv('OPENAI_APIKEY')}"},
+        json={
+            "model": EMBEDDING_MODEL,
+            "input": query,
+            "dimensions": EMBEDDING_DIMENSIONS,
+        },
+        timeout=30,
+    )
+    resp.raise_for_status()
+    embedding = tuple(resp.json()["data"][0]["embedding"])
+    _embedding_disk_cache.put(query, embedding)
+    return embedding
+
+
+def _load_movie_objects(data_url: str) -> list[DataObject]:
+    """Download the movie dataset and convert it into Weaviate data objects."""
+    objects = []
+    with _http.get(data_url, stream=True, timeout=30) as resp:
+        logger.info("📥 Downloading data (status: %s)", resp.status_code)
+        resp.raise_for_status()
+        # Let urllib3 undo any gzip transfer encoding on the raw stream
+        resp.raw.decode_content = True
+        # Parse records incrementally so the raw body is never buffered
+        for movie in ijson.items(resp.raw, "item", use_float=True):
+            objects.append(
+                DataObject(
+                    properties={
+                        "title": movie["title"],
+                        "overview": movie["overview"],
+                        "vote_average": movie["vote_average"],
+                        # Convert a JSON array to a list of integers
+                        "genre_ids": json.loads(movie["genre_ids"]),
+                        # Convert a JSON date to a timezone-aware `datetime`
+                        "release_date": datetime.fromisoformat(
+                            movie["release_date"]
+                        ).replace(tzinfo=timezone.utc),
+                        "tmdb_id": movie["id"],
+                    },
+                    # Derive a deterministic object UUID from the TMDB id
+                    uuid=generate_uuid5(movie["id"]),
+                    # references=reference_obj  # You can add references here
+                )
+            )
+    logger.info("📊 Loaded %d movies", len(objects))
+    return objects
+
+
+def _format_result(rank: int, obj) -> str:
+    """Format a single movie search result for display."""
+    props = obj.properties
+    overview = props["overview"]
+    truncated = overview[:200]
+    if len(truncated) < len(overview):
+        truncated += "..."
+    return (
+        f"**{rank}. {props['title']}** ({props['release_date'].year})\n"
+        f"Rating: {props['vote_average']}/10\n"
+        f"Overview: {truncated}\n"
+        f"Relevance Score: {obj.metadata.score:.3f}\n"
+        f"{RESULT_SEPARATOR}\n"
+    )
+
 
 class WeaviateService:
     """Service class for handling all Weaviate operations."""
 
     def __init__(self):
         self.client = None
-        self.is_ready = False
+        # Formatted results keyed by normalized search parameters
+        self._results_cache = TTLCache(maxsize=512, ttl=300)
+        self._ready = asyncio.Event()
+        self._initialization_failed = False
         self.initialization_status = "Initializing..."
 
-    def initialize(self):
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    async def initialize(self):
         """Initialize Weaviate client and set up collection if needed."""
-        print("🚀 Starting Weaviate initialization...")
+        logger.info("🚀 Starting Weaviate initialization...")
         try:
-            print("📋 Loading environment variables...")
+            logger.info("📋 Loading environment variables...")
             load_dotenv()
 
             headers = {
                 "X-OpenAI-Api-Key": os.getenv("OPENAI_APIKEY"),
             }
-
-            print(
-                f"🔌 Connecting to Weaviate at {os.getenv('WEAVIATE_HOST')}:{os.getenv('WEAVIATE_PORT')}..."
+            host = os.getenv("WEAVIATE_HOST")
+            port = int(os.getenv("WEAVIATE_PORT"))
+            grpc_port = int(os.getenv("WEAVIATE_GRPC_PORT", "50051"))
+
+            logger.info(
+                "🔌 Connecting to Weaviate at %s:%s (gRPC port %s)...",
+                host,
+                port,
+                grpc_port,
             )
-            self.client = weaviate.connect_to_local(
-                host=os.getenv("WEAVIATE_HOST"),
-                port=os.getenv("WEAVIATE_PORT"),
-                headers=headers,
+            # The v4 client sends imports and queries over gRPC
+            self.client = weaviate.use_async_with_local(
+                host=host, port=port, grpc_port=grpc_port, headers=headers
             )
-            print("✅ Successfully connected to Weaviate!")
+            await self.client.connect()
+            logger.info("✅ Successfully connected to Weaviate!")
 
             # Check if collection exists
-            print("🔍 Checking for existing collections...")
-            collections = self.client.collections.list_all()
-            print(
-                f"📊 Found {len(collections)} existing collections: {list(collections.keys())}"
+            logger.info("🔍 Checking for existing collections...")
+            collections = await self.client.collections.list_all()
+            logger.info(
+                "📊 Found %d existing collections: %s",
+                len(collections),
+                list(collections.keys()),
             )
 
-            if "Movie" not in collections:
-                print("🎬 Movie collection not found. Creating collection...")
-                self.initialization_status = "Creating collection..."
-                self.create_collection()
-
-                print("📥 Starting data import...")
-                self.initialization_status = (
-                    "Importing data... This may take a few minutes."
+            needs_import = "Movie" not in collections
+            if needs_import:
+                logger.info("🎬 Movie collection not found. Creating collection...")
+            elif not await self._collection_matches_embeddings():
+                # Query vectors would not match the stored ones; the data is
+                # derived entirely from the public dataset, so rebuild it
+                logger.warning(
+                    "⚠️  Movie collection uses a different embedding model or size "
+                    "than %s (%d dimensions). Recreating collection...",
+                    EMBEDDING_MODEL,
+                    EMBEDDING_DIMENSIONS,
+                )
+                await self.client.collections.delete("Movie")
+                needs_import = True
+            elif not await self._collection_import_completed():
+                # An earlier import was interrupted, e.g. by the process dying
+                logger.warning(
+                    "⚠️  Movie collection import did not finish. Recreating collection..."
                 )
-                self.import_data()
+                await self.client.collections.delete("Movie")
+                needs_import = True
+
+            if needs_import:
+                try:
+                    self.initialization_status = "Creating collection..."
+                    await self.create_collection()
+
+                    logger.info("📥 Starting data import...")
+                    self.initialization_status = (
+                        "Importing data... This may take a few minutes."
+                    )
+                    await self.import_data()
+                except BaseException:
+                    # Also on cancellation: drop the partial collection so the
+                    # next start re-imports it
+                    await self.client.collections.delete("Movie")
+                    raise
+                self._results_cache.clear()
             else:
-                print(
+                logger.info(
                     "✅ Movie collection already exists. Skipping creation and import."
                 )
 
-            self.is_ready = True
+            self._ready.set()
             self.initialization_status = "Ready! You can now search for movies."
-            print("🎉 Weaviate initialization completed successfully!")
+            logger.info("🎉 Weaviate initialization completed successfully!")
 
         except Exception as e:
             self.initialization_status = f"Error: {str(e)}"
-            self.is_ready = False
-            print(f"❌ Weaviate initialization failed: {str(e)}")
-
-    def create_collection(self):
+            self._ready.clear()
+            self._initialization_failed = True
+            logger.exception("❌ Weaviate initialization failed: %s", e)
+
+    async def _collection_matches_embeddings(self) -> bool:
+        """Check that the Movie collection embeds with the current model and size."""
+        config = await self.client.collections.use("Movie").config.get()
+        for vector in (config.vector_config or {}).values():
+            model = vector.vectorizer.model
+            if (
+                model.get("model") == EMBEDDING_MODEL
+                and model.get("dimensions") == EMBEDDING_DIMENSIONS
+            ):
+                return True
+        return False
+
+    async def _collection_import_completed(self) -> bool:
+        """Check that the Movie collection carries the import-complete marker."""
+        config = await self.client.collections.use("Movie").config.get()
+        return config.description == IMPORT_COMPLETE_DESCRIPTION
+
+    async def create_collection(self):
         """Create the Movie collection in Weaviate."""
-        print("🏗️  Creating Movie collection with schema...")
-        print(
+        logger.info("🏗️  Creating Movie collection with schema...")
+        logger.info(
             "   - Properties: title, overview, vote_average, genre_ids, release_date, tmdb_id"
         )
-        print("   - Vectorizer: text2vec-openai")
-        print("   - Generative: openai")
+        logger.info(
+            "   - Vectorizer: text2vec-openai (%s, %d dimensions)",
+            EMBEDDING_MODEL,
+            EMBEDDING_DIMENSIONS,
+        )
+        logger.info("   - Vector index: HNSW with binary quantization")
+        logger.info("   - Generative: openai")
 
-        self.client.collections.create(
+        await self.client.collections.create(
             name="Movie",
             properties=[
                 wc.Property(name="title", data_type=wc.DataType.TEXT),
@@ -91,132 +381,187 @@ class WeaviateService:
                 wc.Property(name="release_date", data_type=wc.DataType.DATE),
                 wc.Property(name="tmdb_id", data_type=wc.DataType.INT),
             ],
-            # Define the vectorizer module
-            vector_config=wc.Configure.Vectors.text2vec_openai(),
+            # Define the vectorizer module (pinned so query embeddings match)
+            # and a binary-quantized HNSW index, rescoring candidates with the
+            # full-precision vectors to recover recall
+            vector_config=wc.Configure.Vectors.text2vec_openai(
+                model=EMBEDDING_MODEL,
+                dimensions=EMBEDDING_DIMENSIONS,
+                vector_index_config=wc.Configure.VectorIndex.hnsw(
+                    ef=128,
+                    ef_construction=256,
+                    max_connections=32,
+                    quantizer=wc.Configure.VectorIndex.Quantizer.bq(rescore_limit=200),
+                ),
+            ),
             # Define the generative module
             generative_config=wc.Configure.Generative.openai(),
         )
-        print("✅ Movie collection created successfully!")
+        logger.info("✅ Movie collection created successfully!")
 
-    def import_data(self):
+    async def import_data(self):
         """Import movie data from external source."""
         data_url = "https://raw.githubusercontent.com/weaviate-tutorials/edu-datasets/main/movies_data_1990_2024.json"
-        print(f"🌐 Fetching movie data from: {data_url}")
-
-        resp = requests.get(data_url)
-        print(f"📥 Downloaded data (status: {resp.status_code})")
+        logger.info("🌐 Fetching movie data from: %s", data_url)
 
-        df = pd.DataFrame(resp.json())
-        print(f"📊 Loaded {len(df)} movies into DataFrame")
+        # Download and convert off the event loop so searches stay responsive
+        objects = await asyncio.to_thread(_load_movie_objects, data_url)
 
         # Get the collection
         movies = self.client.collections.use("Movie")
-        print("🎬 Using Movie collection for import...")
-
-        # Enter context manager
-        print("📦 Starting batch import (batch size: 200)...")
-        with movies.batch.fixed_size(batch_size=200) as batch:
-            # Loop through the data
-            for i, movie in tqdm(df.iterrows(), total=len(df), desc="Importing movies"):
-                # Convert data types
-                # Convert a JSON date to `datetime` and add time zone information
-                release_date = datetime.strptime(
-                    movie["release_date"], "%Y-%m-%d"
-                ).replace(tzinfo=timezone.utc)
-                # Convert a JSON array to a list of integers
-                genre_ids = json.loads(movie["genre_ids"])
-
-                # Build the object payload
-                movie_obj = {
-                    "title": movie["title"],
-                    "overview": movie["overview"],
-                    "vote_average": movie["vote_average"],
-                    "genre_ids": genre_ids,
-                    "release_date": release_date,
-                    "tmdb_id": movie["id"],
-                }
-
-                # Add object to batch queue
-                batch.add_object(
-                    properties=movie_obj,
-                    uuid=generate_uuid5(movie["id"]),
-                    # references=reference_obj  # You can add references here
+        logger.info("🎬 Using Movie collection for import...")
+
+        logger.info("📦 Starting import (batch size: 200, concurrent requests: 4)...")
+        # Keep several batches in flight so vectorization latency overlaps
+        semaphore = asyncio.Semaphore(4)
+        progress = tqdm(total=len(objects), desc="Importing movies")
+
+        async def insert_batch(batch: list[DataObject]) -> int:
+            for attempt in range(IMPORT_MAX_ATTEMPTS):
+                if attempt:
+                    # Back off with jitter so rate-limited batches don't retry
+                    # in lockstep
+                    await asyncio.sleep(2**attempt * 0.5 + random.uniform(0, 0.5))
+                async with semaphore:
+                    try:
+                        result = await movies.data.insert_many(batch)
+                    except WeaviateBaseError as e:
+                        logger.warning("⚠️  Batch insert failed, retrying: %s", e)
+                        continue
+                # Only resubmit the objects that failed (e.g. vectorizer 429s)
+                failed_batch = [batch[i] for i in sorted(result.errors)]
+                progress.update(len(batch) - len(failed_batch))
+                if not failed_batch:
+                    return 0
+                logger.warning(
+                    "⚠️  %d objects failed to import, retrying: %s",
+                    len(failed_batch),
+                    next(iter(result.errors.values())).message,
                 )
-                # Batcher automatically sends batches
+                batch = failed_batch
+            return len(batch)
 
-        # Check for failed objects
-        if len(movies.batch.failed_objects) > 0:
-            print(f"❌ Failed to import {len(movies.batch.failed_objects)} objects")
-        else:
-            print("✅ All movies imported successfully!")
+        # A TaskGroup cancels the remaining batches as soon as one raises, so
+        # nothing is still inserting when the caller cleans up
+        try:
+            with progress:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(insert_batch(objects[i : i + 200]))
+                        for i in range(0, len(objects), 200)
+                    ]
+        except ExceptionGroup as eg:
+            # Surface the batch's own error in the status, not the group
+            raise eg.exceptions[0] from eg
+        failed = sum(task.result() for task in tasks)
+
+        # Check for failed objects; a partial import must not count as ready
+        if failed > 0:
+            raise RuntimeError(
+                f"Failed to import {failed} objects after {IMPORT_MAX_ATTEMPTS} attempts"
+            )
 
-    def search_movies(self, query: str, limit: int = 10):
-        """Search for movies based on query string and return formatted results."""
-        print(f"🔍 Search request: '{query}' (limit: {limit})")
+        # Mark the import as complete so later starts can trust the collection
+        await movies.config.update(description=IMPORT_COMPLETE_DESCRIPTION)
+        logger.info("✅ All movies imported successfully!")
+
+    async def search_movies(
+        self,
+        query: str,
+        limit: int = 10,
+        year_min: int | None = None,
+        genre_id: int | None = None,
+    ):
+        """Search for movies based on query string and return formatted results.
+
+        Optional year and genre filters are applied by Weaviate before the
+        vector search, narrowing the candidates the HNSW graph has to visit.
+        """
+        logger.debug(
+            "🔍 Search request: '%s' (limit: %d, year_min: %s, genre_id: %s)",
+            query,
+            limit,
+            year_min,
+            genre_id,
+        )
+
+        if not self.is_ready and not self._initialization_failed:
+            # Give an in-progress initialization a moment before giving up
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._ready.wait(), timeout=READY_TIMEOUT_SECONDS
+                )
 
-        if not self.is_ready or not self.client:
-            print("⚠️  Search blocked - system not ready")
+        if not self.is_ready:
+            logger.warning("⚠️  Search blocked - system not ready")
             return (
                 None,
                 f"⚠️ System is not ready yet. Please wait for initialization to complete.\n\nCurrent status: {self.initialization_status}",
             )
 
         if not query.strip():
-            print("⚠️  Empty query provided")
+            logger.debug("⚠️  Empty query provided")
             return None, "Please enter a search query."
 
+        normalized_query = query.strip().lower()
+        cache_key = (normalized_query, limit, year_min, genre_id)
+        if (cached := self._results_cache.get(cache_key)) is not None:
+            logger.debug("⚡ Returning cached results for: '%s'", query)
+            return cached, None
+
         try:
             # Get the collection
-            print("🎬 Accessing Movie collection...")
+            logger.debug("🎬 Accessing Movie collection...")
             movies = self.client.collections.use("Movie")
 
-            # Perform query
-            print(f"🔎 Executing semantic search for: '{query}'")
-            response = movies.query.near_text(
+            # Build metadata pre-filters
+            filters = []
+            if year_min:
+                filters.append(
+                    wq.Filter.by_property("release_date").greater_or_equal(
+                        datetime(year_min, 1, 1, tzinfo=timezone.utc)
+                    )
+                )
+            if genre_id is not None:
+                filters.append(
+                    wq.Filter.by_property("genre_ids").contains_any([genre_id])
+                )
+
+            # Embed the query (cached) and run vector + BM25 search in one
+            # hybrid request, fused server-side with Reciprocal Rank Fusion
+            logger.debug("🔎 Executing hybrid search for: '%s'", query)
+            vector = list(await asyncio.to_thread(_embed_query, normalized_query))
+            response = await movies.query.hybrid(
                 query=query,
+                vector=vector,
+                fusion_type=wq.HybridFusion.RANKED,
+                filters=wq.Filter.all_of(filters) if filters else None,
                 limit=limit,
-                return_metadata=wq.MetadataQuery(distance=True),
+                return_metadata=wq.MetadataQuery(score=True),
             )
 
-            # Format results for display
-            results = []
-            for o in response.objects:
-                result = {
-                    "title": o.properties["title"],
-                    "overview": o.properties["overview"],
-                    "release_date": o.properties["release_date"].year,
-                    "vote_average": o.properties["vote_average"],
-                    "distance": f"{o.metadata.distance:.3f}",
-                }
-                results.append(result)
-
-            print(f"📊 Found {len(results)} results")
-
-            if not results:
-                print("❌ No movies found matching query")
+            logger.debug("📊 Found %d results", len(response.objects))
+
+            if not response.objects:
+                logger.debug("❌ No movies found matching query")
                 return None, "No movies found matching your query."
 
-            # Format results for display
-            formatted_results = []
-            for i, result in enumerate(results, 1):
-                formatted_results.append(
-                    f"**{i}. {result['title']}** ({result['release_date']})\n"
-                    f"Rating: {result['vote_average']}/10\n"
-                    f"Overview: {result['overview'][:200]}{'...' if len(result['overview']) > 200 else ''}\n"
-                    f"Similarity Score: {result['distance']}\n"
-                    f"{'─' * 50}\n"
-                )
+            # Format results for display in a single pass
+            results = "\n".join(
+                _format_result(i, o) for i, o in enumerate(response.objects, 1)
+            )
+            self._results_cache[cache_key] = results
 
-            print("✅ Search completed successfully")
-            return "\n".join(formatted_results), None
+            logger.debug("✅ Search completed successfully")
+            return results, None
 
         except Exception as e:
-            print(f"❌ Search error: {str(e)}")
+            logger.exception("❌ Search error: %s", e)
             return None, f"Error searching movies: {str(e)}"
 
-    def close(self):
+    async def close(self):
         """Close the Weaviate client connection."""
         if self.client:
-            print("🔌 Closing Weaviate connection...")
-            self.client.close()
-            print("✅ Weaviate connection closed")
+            logger.info("🔌 Closing Weaviate connection...")
+            await self.client.close()
+            logger.info("✅ Weaviate connection closed")